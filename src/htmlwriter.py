@@ -13,11 +13,22 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
-import os, jinja2
+import os, json, jinja2
 
 # TODO Find out what this does.
 import sys, locale, codecs; sys.stdout = codecs.getwriter(locale.getpreferredencoding())(sys.stdout)
 
+_RESERVED_KEYWORDS = frozenset([
+	"end",
+	"photoAccessible",
+	"photoVisible",
+])
+
+_OUTPUT_FILENAMES = frozenset([
+	"template.html",
+	"tutorial.html",
+])
+
 class HtmlWriter:
 	theme     = None
 	compress  = None
@@ -45,7 +56,7 @@ class HtmlWriter:
 			return (False, "The path '{}' does not point to a directory, or you may not have sufficient access permissions.".format(path))
 		elif not os.access(path, os.W_OK):
 			return (False, "The path '{}' does not point to a writable directory.".format(path))
-		elif not self.overwrite and (os.access(os.path.join(path, "template.html"), os.F_OK) or os.access(os.path.join(path, "tutorial.html"), os.F_OK)):
+		elif not self.overwrite and not _OUTPUT_FILENAMES.isdisjoint(os.listdir(path)):
 			return (False, "The directory '{}' already contains either a task presenter and or a tutorial. To overwrite them, set the '-f' or '--force' flag.".format(path))
 		else:
 			return (True, None)
@@ -85,10 +96,14 @@ class HtmlWriter:
 		with open(os.path.join(project.path, "template.html"), "w") as output:
 			self.__render(context, output)
 
-		with open(os.path.join(project.path, "tutorial.html"), "w") as output:
+		filename = os.path.join(project.path, "tutorial.html")
+		if project.tutorial is None:
 			# Note that in the event of a non-existent project tutorial configuration,
-			# an empty tutorial.html file is created.
-			if project.tutorial is not None:
+			# an empty tutorial.html file is created. Since nothing is written to
+			# it, there's no need to go through a buffered file object.
+			os.close(os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666))
+		else:
+			with open(filename, "w") as output:
 				css, js = self.theme.getasset("tutorial")
 				context["tutorial"] = str(project.tutorial)
 				context["tutorial_len"] = len(project.tutorial)
@@ -104,33 +119,46 @@ class HtmlWriter:
 		"""__render(context:dict, f:file)
 		Renders a Jinja2 template in the given context, to the specified file in HTML format.
 		"""
-		html = self.theme.template.render(context)
-		if html is not None and len(html) > 0:
-			if self.compress:
-				import htmlmin
-				html = htmlmin.minify(html, remove_comments=True, remove_empty_space=True)
-
-			f.write(html.encode("UTF-8"))
+		if self.compress:
+			# The document is minified as it is being rendered, so the unminified
+			# document is never held in memory.
+			import htmlmin
+			minifier = htmlmin.Minifier(remove_comments=True, remove_empty_space=True)
+			for chunk in self.theme.template.generate(context):
+				minifier.input(chunk)
+
+			html = minifier.finalize()
+			if len(html) > 0:
+				f.write(html.encode("UTF-8"))
+		else:
+			# Without compression, there's no need to hold the whole document in
+			# memory: it is streamed to the file as it is being rendered.
+			self.theme.template.stream(context).dump(f, encoding="UTF-8")
 
 
 	@staticmethod
 	def __preprocess(project):
 		# TODO Document me.
 		if project is not None:
-			# Convert the control-flow dictionary into a Javascript object.
-			import json
-			project.questionnaire.controlflow = json.dumps(project.questionnaire.controlflow)
+			# Convert the control-flow dictionary into a Javascript object. If the
+			# project has already been written, it is serialized and is reused
+			# as is, much like a tutorial's serialized entries.
+			if not isinstance(project.questionnaire.controlflow, basestring):
+				project.questionnaire.controlflow = json.dumps(project.questionnaire.controlflow)
 
 			# Load questionnaire help, if it exists.
 			helpdir = os.path.join(project.path, "help")
 			if os.path.isdir(helpdir) and os.access(helpdir, os.R_OK):
-				for filename in [os.path.join(helpdir, f) for f in os.listdir(helpdir) if f.endswith(".html") and len(f) > 5]:
-					key = os.path.splitext(os.path.basename(filename))[0]
-					if key in project.questionnaire.questions:
-						with open(filename) as file:
+				# The key is derived from the file's name, and only the files that
+				# match a question's key are given a full path and read.
+				questions = project.questionnaire.questions
+				for filename in os.listdir(helpdir):
+					key = filename[:-5]
+					if filename.endswith(".html") and key in questions:
+						with open(os.path.join(helpdir, filename)) as file:
 							help = file.read().decode('utf-8').strip()
 							if len(help) > 0:
-								project.questionnaire.questions[key].help = help
+								questions[key].help = help
 
 		return project
 
@@ -141,8 +169,4 @@ class HtmlWriter:
 		Returns true if the specified keyword is reserved for internal use by
 		the HtmlWriter, false otherwise.
 		"""
-		return keyword in [
-			"end",
-			"photoAccessible",
-			"photoVisible",
-		]
+		return keyword in _RESERVED_KEYWORDS
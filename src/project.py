@@ -13,7 +13,7 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
-import os
+import os, copy
 from src.questionnaire import Questionnaire
 from src.tutorial import Tutorial
 
@@ -25,6 +25,7 @@ class Project:
 	why = None
 	questionnaire = None
 	tutorial = None
+	__configurations = {}
 
 
 	def __init__(self, path):
@@ -144,21 +145,60 @@ class Project:
 		Returns the project configuration for the GeoTag-X project located at
 		the specified path. If a tutorial configuration exists, it is included
 		in the returned object.
+		Configurations are cached, and a cached configuration is reused for as
+		long as none of the project's configuration files are modified.
 		"""
 		configuration = None
 		if path is not None and len(path) > 0:
-			import json, yaml
-			parsers = {
-				".json":lambda file: json.loads(file.read()),
-				".yaml":lambda file: yaml.load(file)
-			}
-			configuration = Project.getprojectconfiguration(path, parsers)
+			path = os.path.realpath(path)
+			signature = Project.getsignature(path)
+
+			cached = Project.__configurations.get(path)
+			if cached is not None and cached[0] == signature:
+				configuration = cached[1]
+			else:
+				import json, yaml
+				parsers = {
+					".json":lambda file: json.loads(file.read()),
+					".yaml":lambda file: yaml.load(file)
+				}
+				configuration = Project.getprojectconfiguration(path, parsers)
+				if configuration is not None:
+					configuration["tutorial"] = Project.gettutorialconfiguration(path, parsers)
+					Project.__configurations[path] = (signature, configuration)
+
+			# Return a copy so that the cached configuration can not be modified.
 			if configuration is not None:
-				configuration["tutorial"] = Project.gettutorialconfiguration(path, parsers)
+				configuration = copy.deepcopy(configuration)
 
 		return configuration
 
 
+	@staticmethod
+	def getsignature(path):
+		"""getsignature(path:string)
+		Returns the modification time and size of each configuration file in the
+		directory located at the specified path, or None for missing files.
+		"""
+		signature = []
+		for filename in ["project.json", "project.yaml", "tutorial.json", "tutorial.yaml"]:
+			try:
+				status = os.stat(os.path.join(path, filename))
+				signature.append((status.st_mtime, status.st_size))
+			except OSError:
+				signature.append(None)
+
+		return tuple(signature)
+
+
+	@staticmethod
+	def clearcache():
+		"""clearcache()
+		Discards all cached project configurations.
+		"""
+		Project.__configurations.clear()
+
+
 	@staticmethod
 	def getprojectconfiguration(path, parsers):
 		"""getprojectconfiguration(path:string, parsers:dict)
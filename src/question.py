@@ -13,13 +13,122 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
-class Question:
-	key = None
-	type = None
-	question = None
-	hint = None
-	help = None
-	parameters = None
+import re, string
+from src.htmlwriter import HtmlWriter
+
+# Byte string keys are validated by deleting every legal character, which is
+# faster than matching them against a regular expression. Unicode keys, which
+# don't support deletion tables, are matched against the expression instead.
+_KEY_CHARACTERS = string.ascii_letters + string.digits + "_-"
+_KEY_RE = re.compile(r"\A[\w-]+\Z")
+
+_TYPES = frozenset([
+	"binary",
+	"dropdown-list",
+	"select",
+	"checklist",
+	"illustrative-checklist",
+	"text",
+	"longtext",
+	"number",
+	"datetime",
+	"date",
+	"url",
+	"geotagging",
+	"custom"
+])
+
+_DEPRECATED_TYPES = {
+	"single_choice":"select",
+	"multiple_choice":"checklist",
+	"illustrated_multiple_choice":"illustrative-checklist",
+	"textinput":"text",
+	"textarea":"longtext"
+}
+
+
+def _iskey(key):
+	"""iskey(key:string)
+	Returns true if the specified key is valid, false otherwise.
+	A key is considered valid if it is a non-empty string that is strictly
+	composed of alphanumeric characters, hypens or underscores, and no
+	whitespace. It must also not be a reserved keyword.
+	"""
+	valid, message = False, None
+
+	if not isinstance(key, basestring) or len(key) < 1:
+		message = "Error! A question key must be a non-empty string."
+	elif (_KEY_RE.match(key) is None) if isinstance(key, unicode) else key.translate(None, _KEY_CHARACTERS):
+		message = "Error! The key '{}' contains an illegal character. A key may only contain letters (a-z, A-Z), numbers (0-9), hyphens (-), and underscores (_). It must not contain any whitespace.".format(key)
+	elif HtmlWriter.isreservedkeyword(key):
+		message = "Error! The string '{}' is a reserved keyword and can not be used as a question key.".format(key)
+	else:
+		valid = True
+
+	return (valid, message)
+
+
+def _istype(type):
+	"""istype(type:string)
+	Returns true if the type is valid, false otherwise.
+	"""
+	if type not in _TYPES:
+		if type in _DEPRECATED_TYPES:
+			return (False, "Error! The question type '{}' is deprecated and has been replaced with '{}'.".format(type, _DEPRECATED_TYPES[type]))
+		else:
+			return (False, "Error! The question type '{}' is not recognized.".format(type))
+	else:
+		return (True, None)
+
+
+def _isquestion(question):
+	"""isquestion(question:string)
+	Returns true if the question is valid, false otherwise.
+	A question is considered valid if it is a non-empty string.
+	"""
+	if isinstance(question, basestring) and len(question) > 0:
+		return (True, None)
+	else:
+		return (False, "Error! A question must be a non-empty string.")
+
+
+def _isparameters(parameters):
+	"""isparameters(parameters:dict)
+	Returns true if the parameters are valid, false otherwise.
+	"""
+	if parameters is None or isinstance(parameters, dict):
+		return (True, None)
+	else:
+		return (False, "Error! Question parameters must be a dictionary.")
+
+
+# The validators are run in order, from the cheapest to the most expensive, and
+# validation stops at the first failure.
+_VALIDATORS = (
+	("key",        _iskey),
+	("type",       _istype),
+	("question",   _isquestion),
+	("parameters", _isparameters)
+)
+
+
+def _isvalid(question):
+	"""isvalid(question:Question)
+	Returns true if the question is valid, false otherwise.
+	"""
+	for field, validator in _VALIDATORS:
+		valid, message = validator(getattr(question, field))
+		if not valid:
+			return (False, message)
+
+	return (True, None)
+
+
+class Question(object):
+	# Questionnaires may contain a large number of questions, so instances do
+	# without a per-instance dictionary. Note that __slots__ is only honoured
+	# by new-style classes.
+	__slots__ = ("key", "type", "question", "hint", "help", "parameters")
 	__default_parameters = {
 		"binary":{},
 		"dropdown-list":{
@@ -80,6 +189,7 @@ class Question:
 
 		self.type       = configuration.get("type")
 		self.type       = self.type.strip() if isinstance(self.type, basestring) else None
+		self.type       = intern(self.type) if isinstance(self.type, str) else self.type
 
 		self.question   = configuration.get("question")
 		self.question   = self.question.strip() if isinstance(self.question, basestring) else None
@@ -87,114 +197,20 @@ class Question:
 		self.hint       = configuration.get("hint")
 		self.hint       = self.hint.strip() if isinstance(self.hint, basestring) else None
 
+		self.help       = None
+
 		self.parameters = Question.getparameters(self.type, configuration.get("parameters"))
 
-		valid, message = Question.isvalid(self)
+		valid, message = _isvalid(self)
 		if not valid:
 			raise Exception(message)
 
 
-	@staticmethod
-	def isvalid(question):
-		"""isvalid(question:Question)
-		Returns true if the question is valid, false otherwise.
-		"""
-		validations = {
-			Question.iskey:        question.key,
-			Question.istype:       question.type,
-			Question.isquestion:   question.question,
-			Question.isparameters: question.parameters
-		}
-		for validator, value in validations.items():
-			valid, message = validator(value)
-			if not valid:
-				return (False, message)
-
-		return (True, None)
-
-
-	@staticmethod
-	def iskey(key):
-		"""iskey(key:string)
-		Returns true if the specified key is valid, false otherwise.
-		A key is considered valid if it is a non-empty string that is strictly
-		composed of alphanumeric characters, hypens or underscores, and no
-		whitespace. It must also not be a reserved keyword.
-		"""
-		from src.htmlwriter import HtmlWriter
-		from re import match
-
-		valid, message = False, None
-
-		if not isinstance(key, basestring) or len(key) < 1:
-			message = "Error! A question key must be a non-empty string."
-		elif match(r"[\w-]*", key).group() != key:
-			message = "Error! The key '{}' contains an illegal character. A key may only contain letters (a-z, A-Z), numbers (0-9), hyphens (-), and underscores (_). It must not contain any whitespace.".format(key)
-		elif HtmlWriter.isreservedkeyword(key):
-			message = "Error! The string '{}' is a reserved keyword and can not be used as a question key.".format(key)
-		else:
-			valid = True
-
-		return (valid, message)
-
-
-	@staticmethod
-	def istype(type):
-		"""istype(type:string)
-		Returns true if the type is valid, false otherwise.
-		"""
-		types = [
-			"binary",
-			"dropdown-list",
-			"select",
-			"checklist",
-			"illustrative-checklist",
-			"text",
-			"longtext",
-			"number",
-			"datetime",
-			"date",
-			"url",
-			"geotagging",
-			"custom"
-		]
-		deprecated = {
-			"single_choice":"select",
-			"multiple_choice":"checklist",
-			"illustrated_multiple_choice":"illustrative-checklist",
-			"textinput":"text",
-			"textarea":"longtext"
-		}
-		if type not in types:
-			if type in deprecated:
-				return (False, "Error! The question type '{}' is deprecated and has been replaced with '{}'.".format(type, deprecated.get(type)))
-			else:
-				return (False, "Error! The question type '{}' is not recognized.".format(type))
-		else:
-			return (True, None)
-
-
-	@staticmethod
-	def isquestion(question):
-		"""isquestion(question:string)
-		Returns true if the question is valid, false otherwise.
-		A question is considered valid if it is a non-empty string.
-		"""
-		if isinstance(question, basestring) and len(question) > 0:
-			return (True, None)
-		else:
-			return (False, "Error! A question must be a non-empty string.")
-
-
-	@staticmethod
-	def isparameters(parameters):
-		"""isparameters(parameters:dict)
-		Returns true if the parameters are valid, false otherwise.
-		"""
-		if parameters is None or isinstance(parameters, dict):
-			return (True, None)
-		else:
-			return (False, "Error! Question parameters must be a dictionary.")
+	isvalid      = staticmethod(_isvalid)
+	iskey        = staticmethod(_iskey)
+	istype       = staticmethod(_istype)
+	isquestion   = staticmethod(_isquestion)
+	isparameters = staticmethod(_isparameters)
 
 
 	@staticmethod
@@ -206,9 +222,11 @@ class Question:
 		"""
 		parameters = Question.__default_parameters[type].copy()
 
-		# Set the user-defined default values.
-		if defaults is not None:
-			for key in [k for k in defaults if defaults[k] is not None]:
-				parameters[key] = defaults[key]
+		# Set the user-defined default values. Note that the default parameters
+		# only hold immutable values, so a shallow copy never aliases them.
+		# Most questions, binary ones in particular, don't have any, in which
+		# case there's nothing to merge.
+		if defaults:
+			parameters.update((k, v) for k, v in defaults.iteritems() if v is not None)
 
 		return parameters
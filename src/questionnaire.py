@@ -15,6 +15,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 from src.question import Question
 
+_MANDATORY_FIELDS = ("key", "type", "question")
+
 class Questionnaire:
 	questions = None
 	questiontypes = None
@@ -39,29 +41,22 @@ class Questionnaire:
 				assert isinstance(configuration, dict), "Error! A question entry must be a dictionary."
 
 				# Check for mandatory keys.
-				for field in ["key", "type", "question"]:
+				for field in _MANDATORY_FIELDS:
 					if field not in configuration:
 						raise Exception("Error! A questionnaire entry is missing the field '{}'.".format(field))
 
 				key = configuration["key"]
-				key = str(key).strip() if isinstance(key, basestring) else None
+				key = intern(str(key).strip()) if isinstance(key, basestring) else None
 
 				valid, message = self.iskey(key, configuration["question"])
 				if valid:
 					question = Question(key, configuration)
 					self.questions[key] = question
-					self.controlflow[key] = configuration.get("branch")
+					self.controlflow[key] = Questionnaire.getbranch(configuration.get("branch"))
 					self.questiontypes.add(question.type)
 				else:
 					raise Exception(message)
 
-			# Convert the strings used as conditions in conditional branches to
-			# lowercase. This will allow the template scripts to perform
-			# case-insensitive string comparisons.
-			for branch in [b for b in self.controlflow.values() if b is not None and isinstance(b, dict)]:
-				for key in branch.keys():
-					branch[key.lower()] = branch.pop(key)
-
 			valid, message = Questionnaire.isvalid(self)
 			if not valid:
 				raise Exception(message)
@@ -132,6 +127,20 @@ class Questionnaire:
 		return "\n".join(output) if len(output) > 0 else "Empty questionnaire."
 
 
+	@staticmethod
+	def getbranch(branch):
+		"""getbranch(branch:string|dict)
+		Returns the control flow entry for the specified branch configuration.
+		The strings used as conditions in conditional branches are converted to
+		lowercase, which allows the template scripts to perform case-insensitive
+		string comparisons. Note that the configuration itself is left as is.
+		"""
+		if isinstance(branch, dict):
+			return {condition.lower():destination for condition, destination in branch.iteritems()}
+		else:
+			return branch
+
+
 	@staticmethod
 	def isvalid(questionnaire):
 		"""isvalid(questionnaire:Questionnaire)
@@ -13,11 +13,29 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
-import unittest
+import os, shutil, tempfile, unittest
 from htmlwriter import HtmlWriter
 
 class TestHtmlWriter(unittest.TestCase):
-	pass
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.path)
+
+	def test_writable_directory(self):
+		writer = HtmlWriter(None, False, False, False, False)
+		self.assertTrue(writer.iswritabledir(self.path)[0], "Empty directory")
+		self.assertFalse(writer.iswritabledir(os.path.join(self.path, "missing"))[0], "Non-existent directory")
+
+		open(os.path.join(self.path, "project.json"), "w").close()
+		self.assertTrue(writer.iswritabledir(self.path)[0], "No task presenter or tutorial")
+
+		open(os.path.join(self.path, "tutorial.html"), "w").close()
+		self.assertFalse(writer.iswritabledir(self.path)[0], "Existing tutorial")
+
+		writer.overwrite = True
+		self.assertTrue(writer.iswritabledir(self.path)[0], "Existing tutorial with the overwrite flag")
 
 
 if __name__ == "__main__":
@@ -13,11 +13,34 @@
 #
 # You should have received a copy of the GNU Affero General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
-import unittest
+import os, json, shutil, tempfile, unittest
 from project import Project
 
 class TestProject(unittest.TestCase):
-	pass
+	def setUp(self):
+		self.path = tempfile.mkdtemp()
+		Project.clearcache()
+
+	def tearDown(self):
+		shutil.rmtree(self.path)
+		Project.clearcache()
+
+	def writeconfiguration(self, configuration, mtime):
+		filename = os.path.join(self.path, "project.json")
+		with open(filename, "w") as file:
+			json.dump(configuration, file)
+		os.utime(filename, (mtime, mtime))
+
+	def test_cached_configuration(self):
+		self.writeconfiguration({"name":"First"}, 1000000000)
+		configuration = Project.getconfiguration(self.path)
+		self.assertEqual(configuration, {"name":"First", "tutorial":None})
+
+		configuration["name"] = "Modified"
+		self.assertEqual(Project.getconfiguration(self.path)["name"], "First", "The cache returns copies")
+
+		self.writeconfiguration({"name":"Second"}, 1000000060)
+		self.assertEqual(Project.getconfiguration(self.path)["name"], "Second", "Modified files are reloaded")
 
 
 if __name__ == "__main__":
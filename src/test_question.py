@@ -26,6 +26,7 @@ class TestQuestion(unittest.TestCase):
 		self.assertTrue(Question.iskey("__key")[0], "Leading underscores")
 		self.assertTrue(Question.iskey("_now-y0u_4re-pushing-1t")[0], "Mixed characters")
 		self.assertTrue(Question.iskey("_end")[0], "Not a reserved keyword")
+		self.assertTrue(Question.iskey(u"unicode-key_0")[0], "Unicode string")
 
 	def test_illegal_keys(self):
 		self.assertFalse(Question.iskey("")[0], "Empty string")
@@ -37,6 +38,35 @@ class TestQuestion(unittest.TestCase):
 		self.assertFalse(Question.iskey("photoVisible")[0], "Reserved keyword")
 		self.assertFalse(Question.iskey(32768)[0], "Not a string")
 		self.assertFalse(Question.iskey("\n")[0], "Illegal escape character")
+		self.assertFalse(Question.iskey("key\n")[0], "Trailing newline")
+		self.assertFalse(Question.iskey("k\xc3\xa9y")[0], "Non-ASCII characters")
+		self.assertFalse(Question.iskey(u"end")[0], "Reserved unicode keyword")
+
+	def test_types(self):
+		self.assertTrue(Question.istype("binary")[0], "Supported type")
+		self.assertTrue(Question.istype("custom")[0], "Custom type")
+		self.assertFalse(Question.istype("textarea")[0], "Deprecated type")
+		self.assertFalse(Question.istype("Binary")[0], "Case-sensitive type")
+		self.assertFalse(Question.istype(None)[0], "Not a string")
+
+	def test_validation_order(self):
+		question = Question("key", {"type":"binary", "question":"Is this a question?"})
+		self.assertEqual(Question.isvalid(question), (True, None))
+
+		question.key, question.question = "end", None
+		valid, message = Question.isvalid(question)
+		self.assertFalse(valid)
+		self.assertIn("reserved keyword", message, "The key is validated first")
+
+	def test_parameters(self):
+		parameters = Question.getparameters("text", {"maxlength":64, "placeholder":None, "pattern":"[a-z]+"})
+		self.assertEqual(parameters, {"placeholder":None, "maxlength":64, "pattern":"[a-z]+"})
+
+		parameters["maxlength"] = 32
+		self.assertEqual(Question.getparameters("text")["maxlength"], 128, "Defaults are not aliased")
+
+		self.assertEqual(Question.getparameters("binary", {}), {}, "No user-defined defaults")
+		self.assertIsNot(Question.getparameters("binary"), Question.getparameters("binary"), "Questions own their parameters")
 
 
 if __name__ == "__main__":
@@ -17,7 +17,15 @@ import unittest
 from questionnaire import Questionnaire
 
 class TestQuestionnaire(unittest.TestCase):
-	pass
+	def test_branch_conditions(self):
+		branch = {"Yes":"end", "NO":"second"}
+		configuration = [
+			{"key":"first", "type":"binary", "question":"First question?", "branch":branch},
+			{"key":"second", "type":"binary", "question":"Second question?"}
+		]
+		questionnaire = Questionnaire(configuration)
+		self.assertEqual(questionnaire.controlflow["first"], {"yes":"end", "no":"second"}, "Lowercase conditions")
+		self.assertEqual(branch, {"Yes":"end", "NO":"second"}, "Unchanged configuration")
 
 
 if __name__ == "__main__":